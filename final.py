@@ -1,13 +1,13 @@
 import streamlit as st
-from datetime import datetime
+import streamlit.components.v1 as components
 from zoneinfo import ZoneInfo
-import pandas as pd
-import time
-import base64
+import json
+import os
 
 # --- constants --------------------------------------------------------------
 SECONDS_PER_DAY     = 24 * 60 * 60
-UPDATE_INTERVAL_SEC = 2
+UPDATE_INTERVAL_SEC = 1   # client-side counter refresh
+METRICS_HEIGHT_PX   = 650
 TZ                  = ZoneInfo("America/Los_Angeles")
 
 # --- ONLY PLASTIC-RELATED CONSTANTS ---
@@ -20,43 +20,138 @@ OCEAN_PLASTIC_KG_PER_SECOND = TOTAL_DAILY_OCEAN_PLASTIC_KG / SECONDS_PER_DAY
 TOTAL_DAILY_MICROPLASTIC_MG = 714.0
 MICROPLASTIC_MG_PER_SECOND = TOTAL_DAILY_MICROPLASTIC_MG / SECONDS_PER_DAY
 
-
-# --- Font Loader (kept as it's a styling utility) ---------------------------
-def load_woff_font_base64(path):
-    with open(path, "rb") as f:
-        return base64.b64encode(f.read()).decode()
-
-
-# --- helper functions ------------------------------------------------------
-
-def time_elapsed_seconds(now: datetime) -> float:
-    midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
-    elapsed = (now - midnight).total_seconds()
-    return max(0, min(elapsed, SECONDS_PER_DAY))
-
-def format_elapsed_hours(seconds: float) -> str:
-    hours = int(seconds // 3600)
-    return f"Running Time: {hours} hours"
-
-# --- ONLY PLASTIC-RELATED CALCULATION FUNCTIONS ---
-def plastic_produced_so_far(now: datetime) -> float:
-    return PLASTIC_KG_PER_SECOND * time_elapsed_seconds(now)
-
-def ocean_plastic_entered_so_far(now: datetime) -> float:
-    return OCEAN_PLASTIC_KG_PER_SECOND * time_elapsed_seconds(now)
-
-def microplastic_ingested_so_far(now: datetime) -> float:
-    return MICROPLASTIC_MG_PER_SECOND * time_elapsed_seconds(now)
-
-def k_format(val: float) -> str:
-    if val >= 1_000_000_000:
-        return f"{val / 1_000_000_000:.1f}B".rstrip('0').rstrip('.')
-    elif val >= 1_000_000:
-        return f"{val / 1_000_000:.1f}M".rstrip('0').rstrip('.')
-    elif val >= 1_000:
-        return f"{val / 1_000:.0f}k"
-    else:
-        return f"{val:,.0f}"
+# --- comparison factors ---
+CARS_PER_KG    = 1.0 / 1500          # ~1,500 kg per car
+STATUES_PER_KG = 1.0 / 204116        # Statue of Liberty is ~204,116 kg
+CC_PCT_PER_MG  = 7.0 / 5000 * 100    # a week of intake as % of a 5 g credit card
+
+# Comparison rates folded into a single per-second multiplier per metric
+PLASTIC_PER_SEC_TO_CARS = PLASTIC_KG_PER_SECOND * CARS_PER_KG
+OCEAN_PER_SEC_TO_STATUES = OCEAN_PLASTIC_KG_PER_SECOND * STATUES_PER_KG
+MICRO_PER_SEC_TO_CC_PCT = MICROPLASTIC_MG_PER_SECOND * CC_PCT_PER_MG
+
+# --- dashboard layout: one entry per metric block, rendered left to right ---
+METRICS = (
+    {
+        "label": "Plastic Produced Today",
+        "rate": PLASTIC_KG_PER_SECOND,
+        "value_suffix": " kg",
+        "comparison_rate": PLASTIC_PER_SEC_TO_CARS,
+        "comparison_decimals": 0,
+        "comparison_suffix": " cars",
+        "image": "Frame%2018.png",
+    },
+    {
+        "label": "Plastic Entered Ocean Today",
+        "rate": OCEAN_PLASTIC_KG_PER_SECOND,
+        "value_suffix": " kg",
+        "comparison_rate": OCEAN_PER_SEC_TO_STATUES,
+        "comparison_decimals": 0,
+        "comparison_suffix": " Statues of Liberty",
+        "image": "Frame%2017.png",
+    },
+    {
+        "label": "Microplastic Ingested Today",
+        "rate": MICROPLASTIC_MG_PER_SECOND,
+        "value_suffix": " mg",
+        "comparison_rate": MICRO_PER_SEC_TO_CC_PCT,
+        "comparison_decimals": 1,
+        "comparison_suffix": "% credit card/week",
+        "image": "Frame%2020.png",
+    },
+)
+
+
+# --- Font / styling ---------------------------------------------------------
+# Served by Streamlit's static file server (see .streamlit/config.toml), so the
+# font is fetched once by the browser instead of being inlined as base64.
+FONT_PATH = "static/Qartella.woff"
+
+FONT_FACE_CSS = """
+    @font-face {
+        font-family: 'Qartella';
+        src: url('app/static/Qartella.woff') format('woff');
+        font-weight: normal;
+        font-style: normal;
+    }
+"""
+
+# Page-level rules that need the font; only added when the font file exists.
+PAGE_FONT_CSS = FONT_FACE_CSS + """
+    html, body, [class*="st-"] {
+        font-family: 'Qartella', serif !important;
+    }
+"""
+
+PAGE_BASE_CSS = """
+    .stApp {
+        background-color: #0E1117;
+        color: white;
+    }
+"""
+
+# The metric row lives in its own components iframe, so it carries its own
+# copy of the font and block styles.
+METRICS_CSS = """
+    body {
+        margin: 0;
+        font-family: 'Qartella', serif;
+        color: white;
+    }
+
+    .metric-block {
+        margin-bottom: 0px;
+        text-align: center; /* This centers the text within the metric-block div */
+    }
+    .metric-block p {
+        margin-top: 0px;
+    }
+    .metric-label {
+        color: white;
+        font-size: 1.5em;
+        margin-bottom: 5px;
+        white-space: nowrap;
+    }
+    .metric-value {
+        color: white;
+        font-size: 3em;
+        font-weight: bold;
+        margin-bottom: 5px;
+        white-space: nowrap;
+    }
+    .metric-comparison {
+        color: #70c38B;
+        font-size: 1.8em;
+        margin-top: 0px;
+        white-space: nowrap;
+    }
+    .bottom-left {
+        font-size: 1.1em;
+        font-weight: bold;
+        margin-top: 60px;
+        text-align: center;
+        width: 100%;
+    }
+
+    /* The three metric blocks share one flex row, each centered in its slot */
+    .metric-row {
+        display: flex;
+        justify-content: space-evenly;
+        align-items: flex-start; /* Align content to the top */
+        width: 100%;
+    }
+    .metric-row .metric-block {
+        flex: 1 1 0;
+        display: flex;
+        flex-direction: column; /* Stack children vertically */
+        align-items: center;   /* Center horizontally within the slot */
+    }
+    .metric-image {
+        width: 350px;
+        margin-top: 10px;
+        margin-bottom: 0px;
+    }
+"""
 
 
 # --- Streamlit app main -----------------------------------------------------
@@ -64,170 +159,95 @@ def k_format(val: float) -> str:
 def main():
     st.set_page_config(layout="wide", initial_sidebar_state="collapsed")
 
-    try:
-        qartella_font = load_woff_font_base64("Qartella.woff")
-        st.markdown(f"""
-            <style>
-            @font-face {{
-                font-family: 'Qartella';
-                src: url(data:font/woff;base64,{qartella_font}) format('woff');
-                font-weight: normal;
-                font-style: normal;
+    font_available = os.path.exists(FONT_PATH)
+    if not font_available:
+        st.warning("Qartella.woff font file not found. Using default font.")
+    st.html(f"<style>{PAGE_FONT_CSS if font_available else ''}{PAGE_BASE_CSS}</style>")
+
+    # Sent once per page load; the browser keeps the counters running from
+    # its own clock, so there is no server-side tick at all.
+    components.html(build_metrics_html(font_available), height=METRICS_HEIGHT_PX)
+
+
+@st.cache_data(show_spinner=False)
+def build_metrics_html(font_available: bool) -> str:
+    blocks = "".join(
+        f"""
+            <div class="metric-block">
+                <p class="metric-label">{m["label"]}</p>
+                <p class="metric-value" id="value-{i}"></p>
+                <p class="metric-comparison" id="comparison-{i}"></p>
+                <img class="metric-image" src="app/static/{m["image"]}">
+            </div>"""
+        for i, m in enumerate(METRICS)
+    )
+    rates = json.dumps([
+        {key: m[key] for key in ("rate", "value_suffix", "comparison_rate",
+                                 "comparison_decimals", "comparison_suffix")}
+        for m in METRICS
+    ])
+    return f"""
+        <style>
+        {FONT_FACE_CSS if font_available else ""}
+        {METRICS_CSS}
+        </style>
+        <div class="metric-row">{blocks}
+        </div>
+        <div class="bottom-left" id="running-time"></div>
+        <script>
+        const METRICS = {rates};
+        // Wall-clock time in TZ, so midnight rollover and DST follow the zone
+        const CLOCK = new Intl.DateTimeFormat("en-US", {{
+            timeZone: {json.dumps(TZ.key)},
+            hourCycle: "h23",
+            hour: "numeric",
+            minute: "numeric",
+            second: "numeric",
+        }});
+
+        function secondsSinceMidnight() {{
+            const now = Date.now();
+            const parts = {{}};
+            CLOCK.formatToParts(now).forEach(function (p) {{ parts[p.type] = Number(p.value); }});
+            return parts.hour * 3600 + parts.minute * 60 + parts.second + (now % 1000) / 1000;
+        }}
+
+        // One cached formatter per precision; toLocaleString() builds a new one each call
+        const formatters = {{}};
+        function formatNumber(value, decimals) {{
+            if (!(decimals in formatters)) {{
+                formatters[decimals] = new Intl.NumberFormat("en-US", {{
+                    minimumFractionDigits: decimals,
+                    maximumFractionDigits: decimals,
+                }});
             }}
-
-            html, body, [class*="st-"] {{
-                font-family: 'Qartella', serif !important;
+            return formatters[decimals].format(value);
+        }}
+
+        // Skip the DOM write when the displayed string has not changed
+        function setText(id, text) {{
+            const el = document.getElementById(id);
+            if (el.textContent !== text) {{
+                el.textContent = text;
             }}
+        }}
 
-            .stApp {{
-                background-color: #0E1117;
-                color: white;
-            }}
+        function tick() {{
+            const elapsed = secondsSinceMidnight();
+            METRICS.forEach(function (m, i) {{
+                setText("value-" + i, formatNumber(m.rate * elapsed, 0) + m.value_suffix);
+                setText("comparison-" + i,
+                    "≈" + formatNumber(m.comparison_rate * elapsed, m.comparison_decimals)
+                    + m.comparison_suffix);
+            }});
+            setText("running-time", "Running Time: " + Math.floor(elapsed / 3600) + " hours");
+        }}
 
-            .metric-block {{
-                margin-bottom: 0px;
-                text-align: center; /* This centers the text within the metric-block div */
-            }}
-            .metric-label {{
-                color: white;
-                font-size: 1.5em;
-                margin-bottom: 5px;
-                white-space: nowrap;
-            }}
-            .metric-value {{
-                color: white;
-                font-size: 3em;
-                font-weight: bold;
-                margin-bottom: 5px;
-                white-space: nowrap;
-            }}
-            .metric-comparison {{
-                color: #70c38B;
-                font-size: 1.8em;
-                margin-top: 0px;
-                white-space: nowrap;
-            }}
-            .bottom-left {{
-                font-size: 1.1em;
-                font-weight: bold;
-                margin-top: 60px;
-                text-align: center;
-                width: 100%;
-            }}
-            
-            /* Target Streamlit's column divs to ensure their content is centered */
-            /* Streamlit columns are typically flex containers. We want to align items in the cross-axis. */
-            div[data-testid="stColumn"] {{
-                display: flex;
-                flex-direction: column; /* Stack children vertically */
-                align-items: center;   /* Center horizontally within the column */
-                justify-content: flex-start; /* Align content to the top */
-            }}
+        tick();
+        setInterval(tick, {UPDATE_INTERVAL_SEC * 1000});
+        </script>
+    """
 
-            /* Ensure stImage div also aligns its content */
-            div.stImage {{
-                display: flex;
-                justify-content: center; /* Center image horizontally */
-                align-items: flex-start;
-                margin-top: 10px;
-                margin-bottom: 0px;
-            }}
-            </style>
-        """, unsafe_allow_html=True)
-    except FileNotFoundError:
-        st.warning("Qartella.woff font file not found. Using default font.")
-        st.markdown("""
-            <style>
-            .stApp { background-color: #0E1117; color: white; }
-            .metric-block { margin-bottom: 0px; text-align: center; }
-            .metric-label { color: white; font-size: 1.5em; margin-bottom: 5px; white-space: nowrap; }
-            .metric-value { color: white; font-size: 3em; font-weight: bold; margin-bottom: 5px; white-space: nowrap; }
-            .metric-comparison { white-space: nowrap; }
-            .bottom-left {
-                font-size: 1.1em;
-                font-weight: bold;
-                margin-top: 60px;
-                text-align: center;
-                width: 100%;
-            }
-            div[data-testid="stColumn"] {
-                display: flex;
-                flex-direction: column;
-                align-items: center;
-                justify-content: flex-start;
-            }
-            div.stImage {
-                display: flex;
-                justify-content: center;
-                align-items: flex-start;
-                margin-top: 10px;
-                margin-bottom: 0px;
-            }
-            </style>
-        """, unsafe_allow_html=True)
-
-
-    placeholder = st.empty()
-
-    while True:
-        now = datetime.now(TZ)
-        elapsed_seconds = time_elapsed_seconds(now)
-        running_hours = int(elapsed_seconds // 3600)
-        running_time_str = format_elapsed_hours(elapsed_seconds)
-
-        plastic_produced = plastic_produced_so_far(now)
-        plastic_to_cars = plastic_produced / 1500
-
-        ocean_plastic = ocean_plastic_entered_so_far(now)
-        ocean_to_statues = ocean_plastic / 204116
-
-        microplastic = microplastic_ingested_so_far(now)
-        credit_card_equiv = ((microplastic * 7) / 5000) * 100
-
-        with placeholder.container():
-            # Adjusting column widths to make content columns a bit wider relative to spacers
-            # This might help with perceived centering, though CSS alignment is primary
-            col_widths = [0.5, 4, 1, 4, 1, 4, 0.5] # Reduced spacer width, increased content width
-            
-            s_left, c1, s_1_2, c2, s_2_3, c3, s_right = st.columns(col_widths)
-
-            with c1:
-                st.markdown(f"""
-                    <div class="metric-block">
-                        <p class="metric-label">Plastic Produced Today</p>
-                        <p class="metric-value">{plastic_produced:,.0f} kg</p>
-                        <p class="metric-comparison">≈{plastic_to_cars:,.0f} cars</p>
-                    </div>
-                """, unsafe_allow_html=True)
-                st.image("Frame 18.png", width=350)
-
-            with c2:
-                st.markdown(f"""
-                    <div class="metric-block">
-                        <p class="metric-label">Plastic Entered Ocean Today</p>
-                        <p class="metric-value">{ocean_plastic:,.0f} kg</p>
-                        <p class="metric-comparison">≈{ocean_to_statues:,.0f} Statues of Liberty</p>
-                    </div>
-                """, unsafe_allow_html=True)
-                st.image("Frame 17.png", width=350)
-
-            with c3:
-                st.markdown(f"""
-                    <div class="metric-block">
-                        <p class="metric-label">Microplastic Ingested Today</p>
-                        <p class="metric-value">{microplastic:,.0f} mg</p>
-                        <p class="metric-comparison">≈{credit_card_equiv:.1f}% credit card/week</p>
-                    </div>
-                """, unsafe_allow_html=True)
-                st.image("Frame 20.png", width=350)
-
-            st.markdown(f"""
-                <div class="bottom-left">
-                    Running Time: {running_hours} hours
-                </div>
-            """, unsafe_allow_html=True)
-
-        time.sleep(UPDATE_INTERVAL_SEC)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()